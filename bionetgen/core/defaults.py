@@ -76,13 +76,8 @@ class BNGDefaults:
         # set attributes
         self.bng_path = os.path.join(lib_path, bng_name)
         self.lib_path = lib_path
-        # version banner
-        VERSION_BANNER = """BioNetGen simple command line interface {}\nBioNetGen version: {}\n{}
-        """.format(
-            get_version(), get_latest_bng_version(), get_version_banner()
-        )
-        # set attributes
-        self.banner = VERSION_BANNER
+        # version banner, built the first time it's needed
+        self._banner = None
         # stdout
         CONFIG["bionetgen"]["stdout"] = "PIPE"
         CONFIG["bionetgen"]["stderr"] = "STDOUT"
@@ -90,5 +85,15 @@ class BNGDefaults:
         self.stderr = subprocess.PIPE
         self.config = CONFIG
 
+    @property
+    def banner(self):
+        if self._banner is None:
+            VERSION_BANNER = """BioNetGen simple command line interface {}\nBioNetGen version: {}\n{}
+        """.format(
+                get_version(), get_latest_bng_version(), get_version_banner()
+            )
+            self._banner = VERSION_BANNER
+        return self._banner
+
 
 defaults = BNGDefaults()
@@ -52,11 +52,20 @@ class BNGModelError(BNGError):
 
     def __init__(self, model, message="There was an issue with your BNG model"):
         self.model = model
+        self._message = message
+        super().__init__(message)
+
+    @property
+    def message(self):
+        # turning the model into a string can be expensive, only
+        # do it if the error message is actually requested
         full_msg = f"There was an issue with BNGL model: {self.model}\n"
-        if message is not None:
-            full_msg += message
-        self.message = full_msg
-        super().__init__(self.message)
+        if self._message is not None:
+            full_msg += self._message
+        return full_msg
+
+    def __str__(self):
+        return self.message
 
 
 class BNGRunError(BNGError):
@@ -70,16 +79,43 @@ class BNGRunError(BNGError):
         stderr=None,
     ):
         self.command = command
-        self.stdout = stdout
-        self.stderr = stderr
-        full_msg = f"Tried to run command: {command}\n"
-        full_msg += message + "\n"
-        if stdout is not None:
-            full_msg += f"Stdout was: {stdout}\n"
-        if stderr is not None:
-            full_msg += f"Stderr was: {stderr}\n"
-        self.message = full_msg
-        super().__init__(self.message)
+        # these can be raw bytes from subprocess, they are
+        # only decoded if they are accessed
+        self._stdout = stdout
+        self._stderr = stderr
+        self._message = message
+        super().__init__(message)
+
+    @staticmethod
+    def _decode(out):
+        if isinstance(out, (bytes, bytearray)):
+            return out.decode("utf-8", errors="replace")
+        return out
+
+    @property
+    def stdout(self):
+        self._stdout = self._decode(self._stdout)
+        return self._stdout
+
+    @property
+    def stderr(self):
+        self._stderr = self._decode(self._stderr)
+        return self._stderr
+
+    @property
+    def message(self):
+        # stdout/stderr can be large, only build the full
+        # message if it's actually requested
+        full_msg = f"Tried to run command: {self.command}\n"
+        full_msg += self._message + "\n"
+        if self.stdout is not None:
+            full_msg += f"Stdout was: {self.stdout}\n"
+        if self.stderr is not None:
+            full_msg += f"Stderr was: {self.stderr}\n"
+        return full_msg
+
+    def __str__(self):
+        return self.message
 
 
 class BNGCompileError(BNGError):
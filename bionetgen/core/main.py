@@ -1,4 +1,5 @@
 import subprocess, os, sys
+import bionetgen
 from bionetgen.core.tools import BNGInfo
 from bionetgen.core.tools import BNGVisualize
 from bionetgen.core.tools import BNGCLI
@@ -199,17 +200,33 @@ def generate_notebook(app):
         assert args.input.endswith(
             ".bngl"
         ), f"File {args.input} doesn't have bngl extension!"
-        try:
-            app.log.debug("Loading model", f"{__file__} : notebook()")
-            import bionetgen
-
-            m = bionetgen.bngmodel(args.input)
-            str(m)
-        except:
-            app.log.error("Failed to load model", f"{__file__} : notebook()")
-            raise RuntimeError(f"Couldn't import given model: {args.input}!")
+        # a full parse runs BNG2.pl on the model, only do it if
+        # requested. otherwise peek at the start of the file and
+        # leave the actual loading to the notebook itself
+        strict = getattr(args, "strict", False)
+        if not strict:
+            app.log.debug("Checking model header", f"{__file__} : notebook()")
+            try:
+                with open(args.input, "rb") as f:
+                    head = f.read(4096)
+            except OSError:
+                app.log.error("Failed to read model", f"{__file__} : notebook()")
+                raise RuntimeError(f"Couldn't import given model: {args.input}!")
+            # if we can't find a block in the header (e.g. a long
+            # comment at the top) fall back to parsing the model
+            strict = not (b"begin model" in head or b"begin parameters" in head)
+        m = None
+        if strict:
+            try:
+                app.log.debug("Loading model", f"{__file__} : notebook()")
+                m = bionetgen.bngmodel(args.input)
+                str(m)
+            except:
+                app.log.error("Failed to load model", f"{__file__} : notebook()")
+                raise RuntimeError(f"Couldn't import given model: {args.input}!")
         notebook = BNGNotebook(
             app.config["bionetgen"]["notebook"]["template"],
+            model=m,
             INPUT_ARG=args.input,
         )
     else:
@@ -11,10 +11,16 @@ class BNGNotebook:
     will write the template file to outfile while changing every
     instance of "TEST" to "CHANGE"
 
+    An already loaded model can be given with the `model` keyword,
+    in which case its path is used for "INPUT_ARG" unless that is
+    given explicitly.
+
     Attributes
     ----------
     template : str
         the notebook template to use
+    model : bngmodel
+        the model the notebook is written for, if given
     odict : dict
         the dictionary built from keywords the class is initalized with
 
@@ -24,9 +30,12 @@ class BNGNotebook:
         writes the template file to outfile, replacing keywords
     """
 
-    def __init__(self, nb_template, **kwargs):
+    def __init__(self, nb_template, model=None, **kwargs):
         self.template = nb_template
+        self.model = model
         self.odict = {}
+        if model is not None:
+            self.odict["INPUT_ARG"] = model.model_path
         for key in kwargs:
             self.odict[key] = kwargs[key]
 
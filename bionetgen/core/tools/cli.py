@@ -162,12 +162,9 @@ class BNGCLI:
             # set BNGPATH back
             if self.old_bngpath is not None:
                 os.environ["BNGPATH"] = self.old_bngpath
-            if hasattr(out, "stdout"):
-                stdout_str = out.stdout.decode("utf-8")
-            else:
-                stdout_str = None
-            if hasattr(out, "stdout"):
-                stderr_str = out.stderr.decode("utf-8")
-            else:
-                stderr_str = None
-            raise BNGRunError(command, stdout=stdout_str, stderr=stderr_str)
+            # BNGRunError decodes these only if they are needed
+            raise BNGRunError(
+                command,
+                stdout=getattr(out, "stdout", None),
+                stderr=getattr(out, "stderr", None),
+            )
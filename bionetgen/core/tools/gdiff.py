@@ -27,6 +27,16 @@ class BNGGdiff:
         diff mode, currently available modes are "matrix" and "union"
     """
 
+    # node types by node color, see _get_color_id
+    _COLOR_IDS = {
+        # grey indicates a species
+        "#D2D2D2": 0,
+        # white indicates a component
+        "#FFFFFF": 1,
+        # yellow indicates a state
+        "#FFCC00": 2,
+    }
+
     def __init__(
         self,
         inp1,
@@ -79,10 +89,18 @@ class BNGGdiff:
             loc=f"{__file__} : BNGGdiff.__init__()",
         )
 
-        with open(self.input, "r") as f:
-            self.gdict_1 = xmltodict.parse(f.read())
-        with open(self.input2, "r") as f:
-            self.gdict_2 = xmltodict.parse(f.read())
+        # let expat read the files directly instead of
+        # reading the whole file into a string first, older
+        # xmltodict versions default to OrderedDict which is
+        # larger and slower than a plain (ordered) dict
+        with open(self.input, "rb") as f:
+            self.gdict_1 = xmltodict.parse(f, dict_constructor=dict)
+        with open(self.input2, "rb") as f:
+            self.gdict_2 = xmltodict.parse(f, dict_constructor=dict)
+        # name indices of full graphs, see _get_name_index
+        self._name_indices = {}
+        # yEd properties of each node, see _get_node_properties
+        self._node_properties = {}
 
     def diff_graphs(
         self,
@@ -155,7 +173,8 @@ class BNGGdiff:
                 ".graphml", "_recolored.graphml"
             )
             graphs[g2_recolor_name] = self.gdict_2_recolor
-            # let's do the reverse
+            # let's do the reverse, both graphs
+            # are already recolored at this point
             diff_gml_2, _ = self._find_diff(
                 g2,
                 g1,
@@ -164,6 +183,7 @@ class BNGGdiff:
                     "g2": colors["g1"],
                     "intersect": colors["intersect"],
                 },
+                recolor=False,
             )
             graphs[self.output2] = diff_gml_2
             return graphs
@@ -232,15 +252,15 @@ class BNGGdiff:
 
         # now we loop over g2 nodes and add them to dg with the right
         # colors to get the union version
-        node_stack = [(["graphml"], [], g2["graphml"])]
+        node_stack = [((), g2["graphml"])]
 
         # now we can loop over nodes
-        while len(node_stack) > 0:
+        while node_stack:
             dnode = None
-            curr_keys, curr_names, curr_node = node_stack.pop(-1)
+            curr_names, curr_node = node_stack.pop(-1)
             # let's take a look at the difference
             dnode = self._get_node_from_names(g1, curr_names)
-            if dnode is None and len(curr_names) > 0:
+            if dnode is None and curr_names:
                 # this means we don't have this node in diff graph
                 # we need to add it in
                 dgnode = self._get_node_from_names(dg, curr_names)
@@ -250,54 +270,34 @@ class BNGGdiff:
                     )
                 else:
                     rename_map[self._get_node_id(curr_node)] = self._get_node_id(dgnode)
-            elif dnode is not None and len(curr_names) > 0:
+            elif dnode is not None and curr_names:
                 # we have the same node in g1
                 rename_map[self._get_node_id(curr_node)] = self._get_node_id(dnode)
             # if we have graphs in there, add the nodes to the stack
-            if "graph" in curr_node.keys():
-                # there is a graph in the node, add the nodes to stack
-                if isinstance(curr_node["graph"]["node"], list):
-                    for inode, node in enumerate(curr_node["graph"]["node"]):
-                        ckey = curr_keys + [node["@id"]]
-                        node_stack.append(
-                            (ckey, curr_names + [self._get_node_name(node)], node)
-                        )
-                else:
-                    ckey = curr_keys + [curr_node["graph"]["node"]["@id"]]
-                    node_stack.append(
-                        (
-                            ckey,
-                            curr_names
-                            + [self._get_node_name(curr_node["graph"]["node"])],
-                            curr_node["graph"]["node"],
-                        )
-                    )
+            for node in self._get_child_nodes(curr_node):
+                node_stack.append((curr_names + (self._get_node_name(node),), node))
 
         # now we add edges, gotta deal with node renaming
         edge_ctr = len(dg["graphml"]["graph"]["edge"])
+        # edges we already have, in either direction
+        existing = set()
+        for dedge in dg["graphml"]["graph"]["edge"]:
+            existing.add((dedge["@source"], dedge["@target"]))
+            existing.add((dedge["@target"], dedge["@source"]))
         for edge in g2["graphml"]["graph"]["edge"]:
-            copied_edge = copy.deepcopy(edge)
-            copied_edge["@source"] = rename_map[edge["@source"]]
-            copied_edge["@target"] = rename_map[edge["@target"]]
+            source = rename_map[edge["@source"]]
+            target = rename_map[edge["@target"]]
             # ensure we don't already have the same edge
-            to_add = True
-            for dedge in dg["graphml"]["graph"]["edge"]:
-                # exact edge?
-                if (dedge["@source"] == copied_edge["@source"]) and (
-                    dedge["@target"] == copied_edge["@target"]
-                ):
-                    to_add = False
-                    break
-                # inverse direction?
-                if (dedge["@target"] == copied_edge["@source"]) and (
-                    dedge["@source"] == copied_edge["@target"]
-                ):
-                    to_add = False
-                    break
-            if to_add:
-                copied_edge["@id"] = f"e{edge_ctr}"
-                dg["graphml"]["graph"]["edge"].append(copied_edge)
-                edge_ctr += 1
+            if (source, target) in existing:
+                continue
+            copied_edge = self._copy_graph(edge)
+            copied_edge["@source"] = source
+            copied_edge["@target"] = target
+            copied_edge["@id"] = f"e{edge_ctr}"
+            dg["graphml"]["graph"]["edge"].append(copied_edge)
+            existing.add((source, target))
+            existing.add((target, source))
+            edge_ctr += 1
 
         return dg
 
@@ -311,30 +311,35 @@ class BNGGdiff:
             "g2": ["#c4ed9e", "#d9f4be", "#ecf9df"],
             "intersect": ["#c4ed9e", "#d9f4be", "#ecf9df"],
         },
+        recolor=True,
     ):
         self.logger.debug("Calculating diff", loc=f"{__file__} : BNGGdiff._find_diff()")
         if dg is None:
-            dg = copy.deepcopy(g1)
+            dg = self._copy_graph(g1)
         # keep track of naming
         rename_map = {}
         # first find differences in nodes
         # FIXME: Check for single nodes before looping
-        node_stack = [(["graphml"], [], g1["graphml"])]
-        dnode_stack = [(["graphml"], [], dg["graphml"])]
-        while len(node_stack) > 0:
-            curr_keys, curr_names, curr_node = node_stack.pop(-1)
-            curr_dkeys, curr_dnames, curr_dnode = dnode_stack.pop(-1)
+        # only the names of g1 nodes are needed, the
+        # nodes of dg are in the same positions
+        node_stack = [((), g1["graphml"])]
+        dnode_stack = [dg["graphml"]]
+        while node_stack:
+            curr_names, curr_node = node_stack.pop(-1)
+            curr_dnode = dnode_stack.pop(-1)
             # write down ID map
             rename_map[self._get_node_id(curr_node)] = self._get_node_id(curr_node)
             # let's take a look at the difference
             g2name = None
             g2node = self._get_node_from_names(g2, curr_names)
-            if len(curr_names) > 0:
+            if curr_names:
+                # resize all fonts, this adds +20
+                self._resize_node_font(curr_dnode, 20)
                 # let's get IDs and map them
                 curr_name = self._get_node_name(curr_node)
                 if not (g2node is None):
                     # also check for name
-                    if "data" in g2node.keys():
+                    if "data" in g2node:
                         g2name = self._get_node_name(g2node)
                         if g2name is not None or curr_name is not None:
                             if g2name == curr_name:
@@ -349,135 +354,125 @@ class BNGGdiff:
                                     colors["g1"][self._get_color_id(curr_dnode)],
                                 )
                 else:
-                    if "data" in curr_dnode.keys():
+                    if "data" in curr_dnode:
                         # we don't have the node in g2, we color it appropriately
                         self._color_node(
                             curr_dnode, colors["g1"][self._get_color_id(curr_dnode)]
                         )
             # if we have graphs in there, add the nodes to the stack
-            if "graph" in curr_node.keys():
-                # there is a graph in the node, add the nodes to stack
-                if isinstance(curr_node["graph"]["node"], list):
-                    for inode, node in enumerate(curr_node["graph"]["node"]):
-                        ckey = curr_keys + [node["@id"]]
-                        node_stack.append(
-                            (ckey, curr_names + [self._get_node_name(node)], node)
-                        )
-                        dnode = curr_dnode["graph"]["node"][inode]
-                        dnode_stack.append(
-                            (
-                                curr_dkeys + [dnode["@id"]],
-                                curr_dnames + [self._get_node_name(dnode)],
-                                dnode,
-                            )
-                        )
-                else:
-                    ckey = curr_keys + [curr_node["graph"]["node"]["@id"]]
-                    node_stack.append(
-                        (
-                            ckey,
-                            curr_names
-                            + [self._get_node_name(curr_node["graph"]["node"])],
-                            curr_node["graph"]["node"],
-                        )
-                    )
-                    dnode_stack.append(
-                        (
-                            ckey,
-                            curr_dnames
-                            + [self._get_node_name(curr_dnode["graph"]["node"])],
-                            curr_dnode["graph"]["node"],
-                        )
-                    )
-        # let's recolor both graphs
-        self.gdict_1_recolor = self._recolor_graph(self.gdict_1, self.colors["g1"])
-        self.gdict_2_recolor = self._recolor_graph(self.gdict_2, self.colors["g2"])
-        # resize all fonts, this adds +20
-        self._resize_fonts(self.gdict_1, 20)
-        self._resize_fonts(self.gdict_2, 20)
-        self._resize_fonts(dg, 20)
+            for node, dnode in zip(
+                self._get_child_nodes(curr_node), self._get_child_nodes(curr_dnode)
+            ):
+                node_stack.append((curr_names + (self._get_node_name(node),), node))
+                dnode_stack.append(dnode)
+        if recolor:
+            # let's recolor both graphs
+            # and resize all fonts of the originals, this adds +20
+            self.gdict_1_recolor = self._recolor_graph(
+                self.gdict_1, self.colors["g1"], add_to_font=20
+            )
+            self.gdict_2_recolor = self._recolor_graph(
+                self.gdict_2, self.colors["g2"], add_to_font=20
+            )
         return dg, rename_map
 
-    def _recolor_graph(self, g, color_list):
+    def _recolor_graph(self, g, color_list, add_to_font=None):
         self.logger.debug(
             "Recoloring graphs", loc=f"{__file__} : BNGGdiff._recolor_graph()"
         )
-        recol_g = copy.deepcopy(g)
-        node_stack = [(["graphml"], [], recol_g["graphml"])]
-        while len(node_stack) > 0:
-            curr_keys, curr_names, curr_node = node_stack.pop(-1)
-            if len(curr_names) > 0:
-                self._color_node(curr_node, color_list[self._get_color_id(curr_node)])
-            # if we have graphs in there, add the nodes to the stack
-            if "graph" in curr_node.keys():
-                # there is a graph in the node, add the nodes to stack
-                if isinstance(curr_node["graph"]["node"], list):
-                    for inode, node in enumerate(curr_node["graph"]["node"]):
-                        ckey = curr_keys + [node["@id"]]
-                        node_stack.append(
-                            (ckey, curr_names + [self._get_node_name(node)], node)
-                        )
-                else:
-                    ckey = curr_keys + [curr_node["graph"]["node"]["@id"]]
-                    node_stack.append(
-                        (
-                            ckey,
-                            curr_names
-                            + [self._get_node_name(curr_node["graph"]["node"])],
-                            curr_node["graph"]["node"],
-                        )
-                    )
+        recol_g = self._copy_graph(g)
+        # the copy has the same structure, so both
+        # graphs can be walked over at the same time
+        for node, recol_node in zip(self._iter_nodes(g), self._iter_nodes(recol_g)):
+            self._color_node(recol_node, color_list[self._get_color_id(recol_node)])
+            if add_to_font is not None:
+                # only the original is resized
+                self._resize_node_font(node, add_to_font)
         return recol_g
 
-    def _resize_fonts(self, g, add_to_font):
-        self.logger.debug(
-            "Resizing fonts", loc=f"{__file__} : BNGGdiff._resize_fonts()"
-        )
-        node_stack = [(["graphml"], [], g["graphml"])]
-        while len(node_stack) > 0:
-            curr_keys, curr_names, curr_node = node_stack.pop(-1)
-            if len(curr_names) > 0:
-                self._resize_node_font(curr_node, add_to_font)
+    def _iter_nodes(self, g):
+        """
+        Yields every node of an xmltodict graph, including the
+        nodes nested in group nodes
+        """
+        node_stack = [g["graphml"]]
+        while node_stack:
+            curr_node = node_stack.pop(-1)
             # if we have graphs in there, add the nodes to the stack
-            if "graph" in curr_node.keys():
-                # there is a graph in the node, add the nodes to stack
-                if isinstance(curr_node["graph"]["node"], list):
-                    for inode, node in enumerate(curr_node["graph"]["node"]):
-                        ckey = curr_keys + [node["@id"]]
-                        node_stack.append(
-                            (ckey, curr_names + [self._get_node_name(node)], node)
-                        )
-                else:
-                    ckey = curr_keys + [curr_node["graph"]["node"]["@id"]]
-                    node_stack.append(
-                        (
-                            ckey,
-                            curr_names
-                            + [self._get_node_name(curr_node["graph"]["node"])],
-                            curr_node["graph"]["node"],
-                        )
-                    )
+            for node in self._get_child_nodes(curr_node):
+                yield node
+                node_stack.append(node)
+
+    def _get_child_nodes(self, node) -> list:
+        """
+        Returns the nodes of the graph nested in the given node as a
+        list, xmltodict gives a single node instead of a list of one
+        """
+        if "graph" not in node:
+            return []
+        nodes = node["graph"]["node"]
+        if isinstance(nodes, list):
+            return nodes
+        return [nodes]
+
+    def _copy_graph(self, g):
+        """
+        Copies the dictionaries and lists of an xmltodict graph, or of
+        a node or edge from one. xmltodict only produces dictionaries,
+        lists and strings, and strings are immutable and can be shared
+        with the original. This skips all the object tracking and
+        dispatch copy.deepcopy does.
+        """
+        if isinstance(g, dict):
+            return g.__class__((key, self._copy_graph(val)) for key, val in g.items())
+        if isinstance(g, list):
+            return [self._copy_graph(val) for val in g]
+        return g
+
+    def _get_name_index(self, g) -> dict:
+        """
+        Returns the dictionary that maps the tuple of names leading to
+        each node of the graph to that node. It's built with a single
+        traversal the first time a graph is looked up, nodes added with
+        _add_node_to_graph are added to it.
+        """
+        # the graph is kept with the index so its id can't be reused
+        cached = self._name_indices.get(id(g))
+        if cached is not None and cached[0] is g:
+            return cached[1]
+        index = {(): g["graphml"]}
+        self._index_nodes(index, (), g["graphml"])
+        self._name_indices[id(g)] = (g, index)
+        return index
+
+    def _index_nodes(self, index, names, node):
+        node_stack = [(names, node)]
+        while node_stack:
+            curr_names, curr_node = node_stack.pop(-1)
+            for cnode in self._get_child_nodes(curr_node):
+                cnames = curr_names + (self._get_node_name(cnode),)
+                # like _get_node_from_names, only the first
+                # node with a given name can be found
+                if cnames not in index:
+                    index[cnames] = cnode
+                    node_stack.append((cnames, cnode))
 
     def _get_node_from_names(self, g, names):
-        if "graphml" in g.keys():
-            nodes = g["graphml"]["graph"]["node"]
-            if len(names) == 0:
-                return g["graphml"]
-        else:
-            nodes = g["graph"]["node"]
-            if len(names) == 0:
-                return g
-        copy_names = copy.copy(names)
-        while len(copy_names) > 0:
+        if "graphml" in g:
+            # full graphs are indexed
+            return self._get_name_index(g).get(tuple(names))
+        nodes = g["graph"]["node"]
+        if len(names) == 0:
+            return g
+        for key in names:
             found = False
-            key = copy_names.pop(0)
             if isinstance(nodes, list):
                 for cnode in nodes:
                     cname = self._get_node_name(cnode)
                     if cname == key:
                         found = True
                         node = cnode
-                        if "graph" in node.keys():
+                        if "graph" in node:
                             nodes = node["graph"]["node"]
                     if found:
                         break
@@ -486,24 +481,29 @@ class BNGGdiff:
                 if cname == key:
                     found = True
                     node = nodes
-                if "graph" in node.keys():
+                if "graph" in node:
                     nodes = node["graph"]["node"]
         if not found:
             return None
         return node
 
     def _get_node_properties(self, node):
+        # this is called several times for every node, the node
+        # is kept with its properties so its id can't be reused
+        cached = self._node_properties.get(id(node))
+        if cached is not None and cached[0] is node:
+            return cached[1]
         if isinstance(node["data"], list):
             found = False
             for datum in node["data"]:
-                if "y:ProxyAutoBoundsNode" in datum.keys():
+                if "y:ProxyAutoBoundsNode" in datum:
                     gnode = datum["y:ProxyAutoBoundsNode"]["y:Realizers"]["y:GroupNode"]
                     if isinstance(gnode, list):
                         properties = gnode[0]
                     else:
                         properties = gnode
                     found = True
-                elif "y:ShapeNode" in datum.keys():
+                elif "y:ShapeNode" in datum:
                     snode = datum["y:ShapeNode"]
                     if isinstance(snode, list):
                         properties = snode[0]
@@ -513,14 +513,15 @@ class BNGGdiff:
             if not found:
                 raise RuntimeError("Can't find properties for nodes")
         else:
-            if "y:ProxyAutoBoundsNode" in node["data"].keys():
+            if "y:ProxyAutoBoundsNode" in node["data"]:
                 properties = node["data"]["y:ProxyAutoBoundsNode"]["y:Realizers"][
                     "y:GroupNode"
                 ]
-            elif "y:ShapeNode" in node["data"].keys():
+            elif "y:ShapeNode" in node["data"]:
                 properties = node["data"]["y:ShapeNode"]
             else:
                 raise RuntimeError("Can't find properties for nodes")
+        self._node_properties[id(node)] = (node, properties)
         return properties
 
     def _get_node_name(self, node):
@@ -549,16 +550,8 @@ class BNGGdiff:
         # an attribute to graphml node stating the type of node
         # instead of using colors to check the type
         curr_color = self._get_node_color(node)
-        if curr_color == "#D2D2D2":
-            # grey indicates a species
-            cid = 0
-        elif curr_color == "#FFFFFF":
-            # white indicates a component
-            cid = 1
-        elif curr_color == "#FFCC00":
-            # yellow indicates a state
-            cid = 2
-        else:
+        cid = self._COLOR_IDS.get(curr_color)
+        if cid is None:
             raise RuntimeError(f"Node color {curr_color} doesn't match known colors")
         return cid
 
@@ -569,7 +562,7 @@ class BNGGdiff:
             # we only have "graphml" as key
             return g[gkey]
         # we are out of group nodes
-        if "graph" not in g[gkey].keys():
+        if "graph" not in g[gkey]:
             return None
         # everything up to here is good,
         # loop over to find the node
@@ -643,19 +636,20 @@ class BNGGdiff:
     def _get_id_str(self, id_list) -> str:
         return "::".join([f"n{i}" for i in id_list])
 
+    def _get_last_id(self, idstr) -> int:
+        # same as the last entry of _get_id_list
+        return int(idstr.rsplit("::", 1)[-1][1:])
+
     def _add_node_to_graph(self, node, dg, names, colors=None, rmap={}) -> dict:
         node_to_add_to = self._get_node_from_names(dg, names[:-1])
-        copied_node = copy.deepcopy(node)
+        copied_node = self._copy_graph(node)
         if colors is not None:
             self._color_node(copied_node, colors["g2"][self._get_color_id(copied_node)])
-        if "graph" in node_to_add_to.keys():
+        if "graph" in node_to_add_to:
             if isinstance(node_to_add_to["graph"]["node"], list):
-                # first do renaming
-                node_ids = [
-                    self._get_node_id(node) for node in node_to_add_to["graph"]["node"]
-                ]
-                node_lists = [self._get_id_list(idstr) for idstr in node_ids]
-                new_id = node_lists[-1]
+                # first do renaming, the new node comes after the last one
+                last_id = self._get_node_id(node_to_add_to["graph"]["node"][-1])
+                new_id = self._get_id_list(last_id)
                 new_id[-1] += 1
                 new_id = self._get_id_str(new_id)
                 self._set_node_id(copied_node, new_id)
@@ -665,13 +659,13 @@ class BNGGdiff:
                 # TODO: check if this is done correctly
                 # it's a single node and we need to turn
                 # it into a list instead
-                copied_original_node = copy.deepcopy(node_to_add_to["graph"]["node"])
-                og_node_id = self._get_node_id(copied_original_node)
+                original_node = node_to_add_to["graph"]["node"]
+                og_node_id = self._get_node_id(original_node)
                 new_id = self._get_id_list(og_node_id)
                 new_id[-1] += 1
                 new_id = self._get_id_str(new_id)
                 self._set_node_id(copied_node, new_id)
-                nodes_to_add = [copied_original_node, copied_node]
+                nodes_to_add = [original_node, copied_node]
                 node_to_add_to["graph"]["node"] = nodes_to_add
             # add to rename map
             rmap[self._get_node_id(node)] = self._get_node_id(copied_node)
@@ -681,49 +675,32 @@ class BNGGdiff:
                 # let's rename the graph
                 if "@id" in copied_node["graph"]:
                     copied_node["graph"]["@id"] = self._get_node_id(copied_node) + ":"
-                node_stack = [([], [], copied_node)]
-                while len(node_stack) > 0:
-                    curr_keys, curr_names, curr_node = node_stack.pop(-1)
+                # each node is kept with its parent
+                node_stack = [(None, copied_node)]
+                while node_stack:
+                    parent_node, curr_node = node_stack.pop(-1)
                     # Do stuff here
                     # we need to recolor, re-ID each node and add to rename map
-                    if len(curr_names) > 0:
-                        parent_node = self._get_node_from_names(
-                            copied_node, curr_names[:-1]
-                        )
+                    if parent_node is not None:
                         if colors is not None:
                             self._color_node(
                                 curr_node, colors["g2"][self._get_color_id(curr_node)]
                             )
                         parent_node_id = self._get_node_id(parent_node)
-                        new_id = self._get_id_list(parent_node_id)
-                        curr_id = self._get_id_list(self._get_node_id(curr_node))
-                        new_id += [curr_id[-1]]
-                        new_id = self._get_id_str(new_id)
+                        curr_id = self._get_node_id(curr_node)
+                        # the parent ID was already written here, only
+                        # the last part of the current ID is needed
+                        new_id = f"{parent_node_id}::n{self._get_last_id(curr_id)}"
                         self._set_node_id(curr_node, new_id)
-                        rmap[self._get_id_str(curr_id)] = new_id
+                        rmap[curr_id] = new_id
                     # if we have graphs in there, add the nodes to the stack
-                    if "graph" in curr_node.keys():
-                        # there is a graph in the node, add the nodes to stack
-                        if isinstance(curr_node["graph"]["node"], list):
-                            for inode, node in enumerate(curr_node["graph"]["node"]):
-                                ckey = curr_keys + [node["@id"]]
-                                node_stack.append(
-                                    (
-                                        ckey,
-                                        curr_names + [self._get_node_name(node)],
-                                        node,
-                                    )
-                                )
-                        else:
-                            ckey = curr_keys + [curr_node["graph"]["node"]["@id"]]
-                            node_stack.append(
-                                (
-                                    ckey,
-                                    curr_names
-                                    + [self._get_node_name(curr_node["graph"]["node"])],
-                                    curr_node["graph"]["node"],
-                                )
-                            )
+                    for node in self._get_child_nodes(curr_node):
+                        node_stack.append((curr_node, node))
+            # keep the name index of the graph up to date
+            index = self._get_name_index(dg)
+            if tuple(names) not in index:
+                index[tuple(names)] = copied_node
+                self._index_nodes(index, tuple(names), copied_node)
         return copied_node
 
     def run(self) -> dict:
@@ -731,7 +708,8 @@ class BNGGdiff:
         # Now we have the graphml files, now we do diff
         graphs = self.diff_graphs(self.gdict_1, self.gdict_2, self.colors)
         for graph_name in graphs.keys():
-            # now write gml as graphml
-            with open(graph_name, "w") as f:
+            # now write gml as graphml, xmltodict writes each
+            # bit of markup separately so give the file a large buffer
+            with open(graph_name, "w", buffering=1 << 20) as f:
                 xmltodict.unparse(graphs[graph_name], output=f, pretty=True)
         return graphs
@@ -1,29 +1,161 @@
-import os, bionetgen, glob
+import io, os, errno, shutil, bionetgen
+from collections.abc import Mapping
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
 from tempfile import TemporaryDirectory
 
+from functools import lru_cache
+from bionetgen.core.tools.cli import BNGCLI
+from bionetgen.core.utils import logging as bng_logging
 from bionetgen.core.utils.logging import BNGLogger
 
+# file extensions of the graphs BioNetGen writes
+_GML_SUFFIXES = (".graphml", ".gml")
+# visualization types BNG2.pl knows about, in the order
+# they are generated for "all"
+_VIS_TYPES = (
+    "contactmap",
+    "ruleviz_pattern",
+    "ruleviz_operation",
+    "regulatory",
+)
+
+
+@lru_cache(maxsize=8)
+def _default_logger(level):
+    return BNGLogger()
+
+
+def _get_logger(app):
+    # without an app a BNGLogger only depends on the global log
+    # level at creation, reuse it as long as that doesn't change.
+    # loggers for an app are not cached so the app isn't kept alive
+    if app is not None:
+        return BNGLogger(app=app)
+    return _default_logger(bng_logging.log_level)
+
+
+def _slurp(path):
+    """
+    Reads the whole file at the given path straight into a buffer of
+    the file's size and returns the decoded contents with universal
+    newlines, same as `open(path).read()` would.
+    """
+    with io.FileIO(path, "r") as f:
+        size = os.fstat(f.fileno()).st_size
+        # the buffer is per call since files can be read
+        # from multiple threads
+        buf = bytearray(size)
+        view = memoryview(buf)
+        try:
+            nread = 0
+            # only loops if we got a short read
+            while nread < size:
+                n = f.readinto(view[nread:])
+                if not n:
+                    break
+                nread += n
+        finally:
+            view.release()
+    if nread < size:
+        del buf[nread:]
+    text = buf.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+class _LazyFileDict(Mapping):
+    """
+    Read-only mapping of graph file names to their contents. Files
+    are only read the first time their contents are requested and
+    are kept in memory after that. Asking for all the values at once
+    reads the remaining files in parallel.
+    """
+
+    def __init__(self, folder) -> None:
+        self.folder = folder
+        self._names = []
+        self._contents = {}
+
+    def _add(self, name) -> None:
+        self._names.append(name)
+
+    def __getitem__(self, key):
+        try:
+            return self._contents[key]
+        except KeyError:
+            if key not in self._names:
+                raise
+        contents = _slurp(os.path.join(self.folder, key))
+        self._contents[key] = contents
+        return contents
+
+    def _load_all(self) -> None:
+        # read whatever's left in parallel so we don't wait on
+        # each file in turn (e.g. for vtype "all")
+        to_read = [name for name in self._names if name not in self._contents]
+        if len(to_read) < 2:
+            for name in to_read:
+                self[name]
+            return
+        paths = [os.path.join(self.folder, name) for name in to_read]
+        with ThreadPoolExecutor(max_workers=min(4, len(paths))) as pool:
+            for name, contents in zip(to_read, pool.map(_slurp, paths)):
+                self._contents[name] = contents
+
+    def items(self):
+        self._load_all()
+        return super().items()
+
+    def values(self):
+        self._load_all()
+        return super().values()
+
+    def __contains__(self, key):
+        return key in self._names
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._names})"
+
 
 class VisResult:
     """
     Class that's used to load and write in `.graphml` files generated by BioNetGen.
 
-    Helper class for BNGVisualize
+    Helper class for BNGVisualize. If `expected_files` is given as a
+    list of (model name, visualization type) tuples only the files
+    BioNetGen writes for those are picked up, otherwise the input folder
+    is searched for GML/graphml files (optionally containing `name`).
+    Either way the files are also grouped by visualization type in
+    `files_by_type`, files found by the search that don't end in a
+    known type are only listed in `files`.
     """
 
-    def __init__(self, input_folder, name=None, vtype=None, app=None) -> None:
+    def __init__(
+        self, input_folder, name=None, vtype=None, app=None, expected_files=None
+    ) -> None:
         self.app = app
-        self.logger = BNGLogger(app=self.app)
+        self.logger = _get_logger(self.app)
         self.logger.debug(
             "Setting up VisResult object", loc=f"{__file__} : VisResult.__init__()"
         )
         self.input_folder = input_folder
         self.name = name
         self.vtype = vtype
+        self.expected_files = expected_files
         self.rc = None
         self.out = None
         self.files = []
-        self.file_strs = {}
+        self.files_by_type = {}
+        # file contents are loaded on first access
+        self.file_strs = _LazyFileDict(self.input_folder)
         self.file_graphs = {}
         self._load_files()
 
@@ -31,37 +163,81 @@ class VisResult:
         self.logger.debug(
             "Loading graphml/gml files", loc=f"{__file__} : VisResult._load_files()"
         )
+        if self.expected_files is not None:
+            # we know what BNG2.pl writes for each visualization
+            # type, no need to search the folder for them
+            for name, vtype in self.expected_files:
+                for ext in _GML_SUFFIXES:
+                    gfile = f"{name}_{vtype}{ext}"
+                    if os.path.isfile(os.path.join(self.input_folder, gfile)):
+                        self.files.append(gfile)
+                        self.files_by_type.setdefault(vtype, []).append(gfile)
+                        self.file_strs._add(gfile)
+            return
         # we need to assume some sort of GML output
         # at least for now
-        # use the name, if given, search for GMLs if not
-        gmls = glob.glob("*.gml")
-        graphmls = glob.glob("*.graphml")
-        graphfiles = gmls + graphmls
-        for gfile in graphfiles:
+        # use the name, if given, search for GMLs if not.
+        # a single directory scan picks up both gml and graphml
+        # files and filters by name in the same pass
+        with os.scandir(self.input_folder) as entries:
             if self.name is None:
-                self.files.append(gfile)
-                # now load into string
-                with open(gfile, "r") as f:
-                    l = f.read()
-                self.file_strs[gfile] = l
+                gfiles = [
+                    entry.name
+                    for entry in entries
+                    if entry.name.endswith(_GML_SUFFIXES) and entry.is_file()
+                ]
             else:
                 # pull GMLs that contain the name
-                if self.name in gfile:
-                    self.files.append(gfile)
-                    # now load into string
-                    with open(gfile, "r") as f:
-                        l = f.read()
-                    self.file_strs[gfile] = l
+                name = self.name
+                gfiles = [
+                    entry.name
+                    for entry in entries
+                    if entry.name.endswith(_GML_SUFFIXES)
+                    and name in entry.name
+                    and entry.is_file()
+                ]
+        for gfile in gfiles:
+            self.files.append(gfile)
+            self.file_strs._add(gfile)
+            stem = os.path.splitext(gfile)[0]
+            for vtype in _VIS_TYPES:
+                if stem.endswith("_" + vtype):
+                    self.files_by_type.setdefault(vtype, []).append(gfile)
+                    break
 
     def _dump_files(self, folder) -> None:
         self.logger.debug(
             "Writing graphml/gml files", loc=f"{__file__} : VisResult._dump_files()"
         )
-        os.chdir(folder)
         for gfile in self.files:
             g_name = os.path.split(gfile)[-1]
-            with open(g_name, "w") as f:
-                f.write(self.file_strs[gfile])
+            # copy straight from the original file instead of
+            # writing back the loaded string
+            shutil.copyfile(
+                os.path.join(self.input_folder, gfile), os.path.join(folder, g_name)
+            )
+        # the original files might be removed (e.g. temporary folder)
+        # so any contents not loaded yet are read from the copies
+        self.file_strs.folder = os.path.abspath(folder)
+
+    def _move_files(self, folder) -> None:
+        self.logger.debug(
+            "Moving graphml/gml files", loc=f"{__file__} : VisResult._move_files()"
+        )
+        for gfile in self.files:
+            g_name = os.path.split(gfile)[-1]
+            src = os.path.join(self.input_folder, gfile)
+            dst = os.path.join(folder, g_name)
+            # a rename is enough if we are on the same filesystem
+            try:
+                os.replace(src, dst)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(src, dst)
+        # files are no longer in the input folder
+        self.input_folder = os.path.abspath(folder)
+        self.file_strs.folder = self.input_folder
 
 
 class BNGVisualize:
@@ -93,36 +269,24 @@ class BNGVisualize:
         runs the commands necessary to generate the graph files
     """
 
+    VALID_TYPES = _VIS_TYPES
+    ACCEPT_TYPES = frozenset(VALID_TYPES + ("atom_rule", "all"))
+
     def __init__(
         self, input_file, output=None, vtype=None, bngpath=None, suppress=None, app=None
     ) -> None:
         self.app = app
-        self.logger = BNGLogger(app=self.app)
+        self.logger = _get_logger(self.app)
         self.logger.debug(
             "Setting up BNGVisualize object",
             loc=f"{__file__} : BNGVisualize.__init__()",
         )
         # set input, required
         self.input = input_file
-        # set valid types
-        self.valid_types = [
-            "contactmap",
-            "ruleviz_pattern",
-            "ruleviz_operation",
-            "regulatory",
-        ]
-        self.accept_types = [
-            "contactmap",
-            "ruleviz_pattern",
-            "ruleviz_operation",
-            "regulatory",
-            "atom_rule",
-            "all",
-        ]
         # set visualization type, default yo contactmap
         if vtype is None or len(vtype) == 0:
             vtype = "contactmap"
-        if vtype not in self.accept_types:
+        if vtype not in self.ACCEPT_TYPES:
             raise ValueError(f"{vtype} is not a valid visualization type")
 
         self.vtype = vtype
@@ -143,7 +307,7 @@ class BNGVisualize:
         model = bionetgen.modelapi.bngmodel(self.input)
         model.actions.clear_actions()
         if self.vtype == "all":
-            for valid_type in self.valid_types:
+            for valid_type in self.VALID_TYPES:
                 if valid_type == "regulatory":
                     model.add_action(
                         "visualize",
@@ -169,55 +333,53 @@ class BNGVisualize:
                 )
             else:
                 model.add_action("visualize", action_args={"type": f"'{self.vtype}'"})
+        # these are the graphs BNG2.pl will write for us
+        if self.vtype == "all":
+            vis_types = self.VALID_TYPES
+        elif self.vtype == "atom_rule":
+            vis_types = ["regulatory"]
+        else:
+            vis_types = [self.vtype]
+        expected_files = [(model.model_name, vis_type) for vis_type in vis_types]
         # TODO: Work in temp folder
         cur_dir = os.getcwd()
-        from bionetgen.core.main import BNGCLI
 
         self.logger.debug(
             "Generating visualization files",
             loc=f"{__file__} : BNGVisualize._normal_mode()",
         )
 
-        if self.output is None:
-            with TemporaryDirectory() as out:
-                # instantiate a CLI object with the info
-                cli = BNGCLI(model, out, self.bngpath, suppress=self.suppress)
-                try:
-                    cli.run()
-                    # load vis
-                    vis_res = VisResult(
-                        os.path.abspath(os.getcwd()),
-                        name=model.model_name,
-                        vtype=self.vtype,
-                    )
-                    # go back
-                    os.chdir(cur_dir)
-                    # dump files
-                    vis_res._dump_files(cur_dir)
-                    return vis_res
-                except Exception as e:
-                    os.chdir(cur_dir)
-                    print("Couldn't run the simulation, see error.")
-                    raise e
-        else:
+        with ExitStack() as stack:
+            if self.output is None:
+                out = stack.enter_context(TemporaryDirectory())
+            else:
+                out = self.output
+            out = os.path.abspath(out)
+            # BNGCLI moves into the output folder to run BNG2.pl,
+            # everything else here uses absolute paths so we only
+            # need to go back once it's done (and before the
+            # temporary folder is removed)
+            stack.callback(os.chdir, cur_dir)
             # instantiate a CLI object with the info
-            cli = BNGCLI(model, self.output, self.bngpath, suppress=self.suppress)
+            cli = BNGCLI(model, out, self.bngpath, suppress=self.suppress)
             try:
                 cli.run()
                 # load vis
                 vis_res = VisResult(
-                    os.path.abspath(os.getcwd()),
+                    out,
                     name=model.model_name,
                     vtype=self.vtype,
+                    expected_files=expected_files,
                 )
-                # go back
-                os.chdir(cur_dir)
+                if self.output is None:
+                    # the temporary folder is going away, move
+                    # the files out instead of copying them
+                    vis_res._move_files(cur_dir)
                 return vis_res
             except Exception as e:
                 self.logger.error(
                     "Failed to run file",
                     loc=f"{__file__} : BNGVisualize._normal_mode()",
                 )
-                os.chdir(cur_dir)
                 print("Couldn't run the simulation, see error.")
                 raise e
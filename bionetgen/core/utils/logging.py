@@ -45,6 +45,9 @@ class BNGLogger:
         this attribute sets the logging level to output. Options are
         the same as regular python logging, "DEBUG", "INFO", "WARNING",
         "ERROR", "CRITICAL"
+    debug_on : bool
+        True if DEBUG level messages are written out, can be used to
+        skip building expensive debug messages
 
     Methods
     -------
@@ -83,6 +86,12 @@ class BNGLogger:
         else:
             self.level = level
 
+    @property
+    def debug_on(self):
+        if self.app is not None:
+            return self.app.log.get_level() == "DEBUG"
+        return self.level == "DEBUG"
+
     def get_logger(self, loc=None):
         """
         From a given loc string returns the correct python
@@ -14,7 +14,6 @@ from .core.utils.utils import test_perl
 
 # pull defaults defined in core/defaults
 CONF = bng.defaults
-VERSION_BANNER = bng.defaults.banner
 
 # require version argparse action
 import argparse, sys
@@ -40,6 +39,28 @@ class requireAction(argparse.Action):
         # return super().__call__(parser, namespace, values, option_string=option_string)
 
 
+class versionAction(argparse.Action):
+    def __init__(
+        self,
+        option_strings,
+        dest=argparse.SUPPRESS,
+        default=argparse.SUPPRESS,
+        help="show program's version number and exit",
+    ):
+        super().__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=default,
+            nargs=0,
+            help=help,
+        )
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        # the banner is only put together if it's asked for
+        print(CONF.banner)
+        parser.exit()
+
+
 class BNGBase(cement.Controller):
     """
     Base cement controller for BioNetGen CLI
@@ -68,7 +89,7 @@ class BNGBase(cement.Controller):
         help = "bionetgen"
         arguments = [
             # TODO: Auto-load in BioNetGen version here
-            (["-v", "--version"], dict(action="version", version=VERSION_BANNER)),
+            (["-v", "--version"], dict(action=versionAction)),
             # (['-s','--sedml'],dict(type=str,
             #                        default=CONF.config['bionetgen']['bngpath'],
             #                        help="Optional path to SED-ML file, if available the simulation \
@@ -167,6 +188,13 @@ class BNGBase(cement.Controller):
                     "action": "store_true",
                 },
             ),
+            (
+                ["--strict"],
+                {
+                    "help": "(optional) If given, the model is fully loaded to make sure it's valid before writing the notebook",
+                    "action": "store_true",
+                },
+            ),
         ],
     )
     def notebook(self):
@@ -641,7 +669,7 @@ def main():
             #     traceback.print_exc()
 
         except BNGError as e:
-            print("BNGError > %s" % e.args[0])
+            print("BNGError > %s" % e)
             app.exit_code = 1
             # TODO: figure out if this is what we want,
             # rn it prints stuff twice
@@ -1,6 +1,279 @@
+from itertools import count
 from bionetgen.core.utils.logging import BNGLogger
 
 logger = BNGLogger()
+# debug messages in the comparisons are only built if
+# they would actually be written out
+_DEBUG = logger.debug_on
+_LOC_PAT_EQ = f"{__file__} : Pattern.__eq__()"
+_LOC_MOL_EQ = f"{__file__} : Molecule.__eq__()"
+_LOC_COMP_EQ = f"{__file__} : Component.__eq__()"
+
+# pattern objects are mostly modified in place (e.g. appending to
+# the bonds of a component). every object and every list of
+# molecules, components, states or bonds gets a new stamp when it
+# changes, stamps only go up so an object's cached values are
+# still good as long as the newest stamp below it is the same
+_next_stamp = count(1).__next__
+
+
+class _EmptyItems(tuple):
+    __slots__ = ()
+    _stamp = 0
+
+    # copies and pickles need to give back the shared
+    # instance, the list getters check for it by identity
+    def __reduce__(self):
+        return "_EMPTY"
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+# most components have no states or bonds, they all share this
+# instead of an empty list each, the list getters swap it out for
+# a real list since callers may append to what they get
+_EMPTY = _EmptyItems()
+
+
+class _TrackedList(list):
+    """
+    List of molecules, components, states or bonds that gets a new
+    stamp whenever it's modified, so the object it belongs to can
+    tell its cached values are out of date
+    """
+
+    __slots__ = ("_stamp",)
+
+    def __init__(self, items=()):
+        super().__init__(items)
+        self._stamp = _next_stamp()
+
+    def __reduce_ex__(self, protocol):
+        # copies and pickles get a stamp of their own
+        return (self.__class__, (list(self),))
+
+    def _changed(self):
+        self._stamp = _next_stamp()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def __iadd__(self, other):
+        super().__iadd__(other)
+        self._changed()
+        return self
+
+    def __imul__(self, other):
+        super().__imul__(other)
+        self._changed()
+        return self
+
+    def append(self, item):
+        super().append(item)
+        self._changed()
+
+    def extend(self, items):
+        super().extend(items)
+        self._changed()
+
+    def insert(self, index, item):
+        super().insert(index, item)
+        self._changed()
+
+    def remove(self, item):
+        super().remove(item)
+        self._changed()
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self._changed()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self):
+        super().reverse()
+        self._changed()
+
+
+def _tracked(items):
+    # plain lists handed to a pattern object are copied into a
+    # tracked list, changes to the original are not seen
+    if items is _EMPTY or items.__class__ is _TrackedList:
+        return items
+    return _TrackedList(items)
+
+
+def _comp_stamp(component):
+    # newest stamp of the component and its states and bonds
+    return max(component._stamp, component._states._stamp, component._bonds._stamp)
+
+
+def _get_state(obj):
+    # stamps only mean something next to this process' counter,
+    # copies and pickles leave them and the caches behind
+    return {
+        name: getattr(obj, name)
+        for name in obj.__slots__
+        if name not in obj._cache_slots and hasattr(obj, name)
+    }
+
+
+def _set_state(obj, state):
+    for name in obj._cache_slots:
+        setattr(obj, name, None)
+    for name, value in state.items():
+        setattr(obj, name, value)
+    obj._stamp = _next_stamp()
+
+
+def _sort_by_hash(items):
+    """
+    Returns the items sorted by their hash together with the
+    sorted hashes, equal collections give the same hashes
+    """
+    pairs = sorted((hash(item), iitem) for iitem, item in enumerate(items))
+    return (
+        tuple(items[iitem] for _, iitem in pairs),
+        tuple(item_hash for item_hash, _ in pairs),
+    )
+
+
+def _same_items(items, hashes, other_items, other_hashes, key_fn):
+    """
+    Multiset equality of two collections sorted with _sort_by_hash
+    """
+    # equal items have equal hashes, so this rejects
+    # most mismatches with a single tuple comparison
+    if hashes != other_hashes:
+        return False
+    # usually the items line up once they are sorted
+    if items == other_items:
+        return True
+    # items with the same hash can come in any order,
+    # every item needs its own match among the others
+    buckets = _bucket(other_items, key_fn)
+    return all(_pop_match(item, buckets.get(key_fn(item), [])) for item in items)
+
+
+def _bucket(items, key_fn):
+    """
+    Groups items into a dictionary of lists using key_fn, so
+    that only items that share a key need to be compared
+    """
+    buckets = {}
+    for item in items:
+        key = key_fn(item)
+        if key in buckets:
+            buckets[key].append(item)
+        else:
+            buckets[key] = [item]
+    return buckets
+
+
+def _pop_match(item, candidates):
+    """
+    Removes the first candidate equal to item from the list
+    and returns True, returns False if there isn't one
+    """
+    for icand, cand in enumerate(candidates):
+        if item == cand:
+            candidates.pop(icand)
+            return True
+    return False
+
+
+# bonds that mean the same thing in every pattern, unlike
+# numbered bonds which are only meaningful within one
+_WILDCARD_BONDS = frozenset(("+", "?"))
+
+
+def _wildcard_bonds(bonds):
+    return sorted(str(bond) for bond in bonds if str(bond) in _WILDCARD_BONDS)
+
+
+def _mol_key(molecule):
+    return (
+        molecule._name,
+        molecule._compartment,
+        molecule._label,
+        len(molecule._components),
+    )
+
+
+def _comp_key(component):
+    return (
+        component._name,
+        component._label,
+        component._state,
+        len(component._states),
+        len(component._bonds),
+    )
+
+
+def fast_equal_pattern(pat1, pat2):
+    """
+    Same result as pat1 == pat2 for two Pattern objects, without
+    the type check and the logging of Pattern.__eq__. Meant for
+    code that compares a lot of patterns it knows are patterns.
+    """
+    if pat1 is pat2:
+        return True
+    # pattern-wide properties, the number of molecules
+    # is the cheapest way to tell them apart
+    if len(pat2._molecules) != len(pat1._molecules):
+        return False
+    if pat2._compartment != pat1._compartment:
+        return False
+    if pat2._label != pat1._label:
+        return False
+    # mods
+    if pat2._fixed != pat1._fixed:
+        return False
+    if pat2._MatchOnce != pat1._MatchOnce:
+        return False
+    # quantifiers
+    if pat2._relation != pat1._relation:
+        return False
+    if pat2._quantity != pat1._quantity:
+        return False
+    # if we made the label, we can just compare the two
+    if (pat1.canonical_label is not None) and (pat2.canonical_label is not None):
+        return pat1.canonical_label == pat2.canonical_label
+    # drop whatever the patterns cached before their last change
+    pat1._check_caches()
+    pat2._check_caches()
+    # patterns that were hashed since the last change
+    # can be told apart by their hashes
+    if pat1._hash is not None and pat2._hash is not None and pat1._hash != pat2._hash:
+        return False
+    # now we can check contents, every molecule needs
+    # its own match in the other pattern
+    if not _same_items(*pat1._canon(), *pat2._canon(), _mol_key):
+        return False
+    # isomorphism check if we have the certificate
+    if (pat1.canonical_certificate is not None) and (
+        pat2.canonical_certificate is not None
+    ):
+        if pat1.canonical_certificate != pat2.canonical_certificate:
+            return False
+    # molecules match, check bonds
+    return pat1._bond_signature() == pat2._bond_signature()
 
 
 # All classes that deal with patterns
@@ -21,7 +294,8 @@ class Pattern:
         label of the overall pattern (not the same thing as molecule
         label, those have their own)
     molecules : list[Molecule]
-        list of molecule objects that are in the pattern
+        list of molecule objects that are in the pattern, setting
+        it stores a copy of the given list
     fixed : bool
         used for constant species, sets "$" at the beginning of the
         pattern string
@@ -57,10 +331,56 @@ class Pattern:
         for more information
     """
 
+    # patterns are created in large numbers, no instance dicts
+    __slots__ = (
+        "_molecules",
+        "_bonds",
+        "_compartment",
+        "_label",
+        "_fixed",
+        "_MatchOnce",
+        "_relation",
+        "_quantity",
+        "nautyG",
+        "canonical_certificate",
+        "canonical_label",
+        "_stamp",
+        "_cache_stamp",
+        "_hash",
+        "_str_cache",
+        "_consolidated",
+        "_index",
+        "_canon_cache",
+        "_bond_sig",
+    )
+    _cache_slots = (
+        "_stamp",
+        "_cache_stamp",
+        "_hash",
+        "_str_cache",
+        "_consolidated",
+        "_index",
+        "_canon_cache",
+        "_bond_sig",
+    )
+
     def __init__(
-        self, molecules=[], bonds=None, compartment=None, label=None, canonicalize=False
+        self,
+        molecules=None,
+        bonds=None,
+        compartment=None,
+        label=None,
+        canonicalize=False,
     ):
-        self.molecules = molecules
+        self._stamp = _next_stamp()
+        self._cache_stamp = None
+        self._hash = None
+        self._str_cache = None
+        self._consolidated = False
+        self._index = None
+        self._canon_cache = None
+        self._bond_sig = None
+        self.molecules = [] if molecules is None else molecules
         self._bonds = bonds
         self.compartment = compartment
         self.label = label
@@ -91,8 +411,8 @@ class Pattern:
             )
             return
         # find how many vertices we need
-        lmol = len(self.molecules)
-        lcomp = sum([len(x.components) for x in self.molecules])
+        lmol = len(self._molecules)
+        lcomp = sum([len(x._components) for x in self._molecules])
         node_cnt = lmol + lcomp
         # initialize our pynauty graph
         G = pynauty.Graph(node_cnt)
@@ -110,7 +430,7 @@ class Pattern:
         mCopyId = 0
         cCopyId = 0
         # let's loop over everything in the pattern
-        for molec in self.molecules:
+        for molec in self._molecules:
             # setting colors
             color_id = (molec.name, None, None)
             if color_id in colors:
@@ -129,7 +449,7 @@ class Pattern:
             node_ptrs[currId] = molec
             currId += 1
             # now looping over components
-            for comp in molec.components:
+            for comp in molec._components:
                 # saving component coloring
                 comp_color_id = (molec.name, comp.name, comp.state)
                 if comp_color_id in colors:
@@ -229,85 +549,173 @@ class Pattern:
         """
         # need to make sure we don't print useless compartments
         self.consolidate_molecule_compartments()
-        canon_label = ""
+        parts = []
         # we first deal with the pattern compartment
         if self.compartment is not None:
-            canon_label += "@{}".format(self.compartment)
+            parts.append(f"@{self.compartment}")
         if self.label is not None:
-            canon_label += "%{}".format(self.label)
+            parts.append(f"%{self.label}")
         if self.label is not None or self.compartment is not None:
-            canon_label += ":"
+            parts.append(":")
         # now loop over all molecules in canonical order
-        canon_ords = [m.canonical_order for m in self.molecules]
-        canon_ord_pairs = zip(range(len(self.molecules)), canon_ords)
+        canon_ords = [m.canonical_order for m in self._molecules]
+        canon_ord_pairs = zip(range(len(self._molecules)), canon_ords)
         sorted_canon_ord_pairs = sorted(canon_ord_pairs, key=lambda x: x[1])
         for imol, mol in enumerate(sorted_canon_ord_pairs):
             mol_id = mol[0]
             if imol == 0:
                 if self.fixed:
-                    canon_label += "$"
+                    parts.append("$")
                 if self.MatchOnce:
-                    canon_label += "{MatchOnce}"
+                    parts.append("{MatchOnce}")
             if imol > 0:
-                canon_label += "."
-            canon_label += self.molecules[mol_id].print_canonical()
+                parts.append(".")
+            parts.append(self._molecules[mol_id].print_canonical())
         if self.relation is not None:
-            canon_label += f"{self.relation}{self.quantity}"
-        return canon_label
+            parts.append(f"{self.relation}{self.quantity}")
+        return "".join(parts)
+
+    def _current_stamp(self):
+        # newest stamp anywhere in the pattern
+        stamp = max(self._stamp, self._molecules._stamp)
+        for molecule in self._molecules:
+            mol_stamp = molecule._current_stamp()
+            if mol_stamp > stamp:
+                stamp = mol_stamp
+        return stamp
+
+    def _check_caches(self):
+        # drops the cached values if anything in the pattern changed
+        # since they were made, needs to be called before using them
+        stamp = self._current_stamp()
+        if stamp != self._cache_stamp:
+            self._hash = None
+            self._str_cache = None
+            self._consolidated = False
+            self._index = None
+            self._canon_cache = None
+            self._bond_sig = None
+            self._cache_stamp = stamp
 
     def __contains__(self, val):
-        return val in self.molecules
+        if not isinstance(val, Molecule):
+            return val in self._molecules
+        # only compare against molecules that can match
+        self._check_caches()
+        if self._index is None:
+            self._index = _bucket(self._molecules, _mol_key)
+        return any(val == m for m in self._index.get(_mol_key(val), ()))
+
+    def _canon(self):
+        # molecules sorted by hash and their hashes, used
+        # for comparing and hashing the pattern
+        if self._canon_cache is None:
+            self._canon_cache = _sort_by_hash(self._molecules)
+        return self._canon_cache
+
+    def _bond_signature(self):
+        # every bond described by the components it connects instead
+        # of its label, this way A(b!1).B(a!1) and A(b!2).B(a!2) give
+        # the same signature and comparing bonds is a tuple comparison.
+        # bonds within a molecule are marked separately so that
+        # A(b!1,c!1).A(b!2,c!2) and A(b!1,c!2).A(b!2,c!1) differ
+        if self._bond_sig is None:
+            ends = {}
+            for imol, molecule in enumerate(self._molecules):
+                for component in molecule._components:
+                    end = f"{molecule._name}({component._name}~{component._state})"
+                    for bond in component._bonds:
+                        ends.setdefault(str(bond), []).append((imol, end))
+            sig = []
+            for bond, bond_ends in ends.items():
+                if bond in _WILDCARD_BONDS:
+                    # wildcards are not shared between components
+                    sig.extend(f"{end}!{bond}" for _, end in bond_ends)
+                    continue
+                mol_ids = set(imol for imol, _ in bond_ends)
+                sep = "=" if len(mol_ids) == 1 and len(bond_ends) > 1 else "-"
+                sig.append(sep.join(sorted(end for _, end in bond_ends)))
+            self._bond_sig = tuple(sorted(sig))
+        return self._bond_sig
 
     def __eq__(self, other):
-        loc = f"{__file__} : Pattern.__eq__()"
-        if isinstance(other, Pattern):
-            logger.debug(f"Comparison class matches: {other.__class__}", loc=loc)
-            # checking pattern-wide properties
-            if (other.compartment == self.compartment) and (other.label == self.label):
-                logger.debug(
-                    f"Compartment or label matches: {other.compartment}, {other.label}",
-                    loc=loc,
-                )
-                # checking mods
-                if (other.fixed == self.fixed) and (other.MatchOnce == self.MatchOnce):
-                    logger.debug(
-                        f"fixed or matchonce matches: {other.fixed}, {other.MatchOnce}",
-                        loc=loc,
-                    )
-                    # checking quantifiers
-                    if (other.relation == self.relation) and (
-                        other.quantity == self.quantity
-                    ):
-                        logger.debug(
-                            f"relation or quantity matches: {other.relation}, {other.quantity}",
-                            loc=loc,
-                        )
-                        # if we made the label, we can just compare the two
-                        if (self.canonical_label is not None) and (
-                            other.canonical_label is not None
-                        ):
-                            return self.canonical_label == other.canonical_label
-                        # now we can check contents
-                        for molecule in self:
-                            if molecule not in other.molecules:
-                                logger.debug(
-                                    f"molecule doesn't match: {molecule}", loc=loc
-                                )
-                                return False
-                        # isomorphism check if we have the certificate
-                        if (self.canonical_certificate is not None) and (
-                            other.canonical_certificate is not None
-                        ):
-                            if (
-                                self.canonical_certificate
-                                != other.canonical_certificate
-                            ):
-                                return False
-                        # TODO: molecules match, check bonds
-                        # Bonds match, patterns are the same
-                        logger.debug("patterns match!", loc=loc)
-                        return True
-        return False
+        if self is other:
+            return True
+        if other.__class__ is not Pattern:
+            return False
+        if not fast_equal_pattern(self, other):
+            return False
+        if _DEBUG:
+            logger.debug(f"patterns match: {self}", loc=_LOC_PAT_EQ)
+        return True
+
+    def __hash__(self):
+        # consistent with __eq__, only the molecules are cached
+        # since the rest is cheap to hash
+        self._check_caches()
+        if self._hash is None:
+            self._hash = hash(self._canon()[1])
+        return hash(
+            (
+                self._compartment,
+                self._label,
+                self.fixed,
+                self.MatchOnce,
+                self.relation,
+                self.quantity,
+                self._hash,
+            )
+        )
+
+    @property
+    def fixed(self):
+        return self._fixed
+
+    @fixed.setter
+    def fixed(self, value):
+        self._stamp = _next_stamp()
+        self._fixed = value
+
+    @property
+    def MatchOnce(self):
+        return self._MatchOnce
+
+    @MatchOnce.setter
+    def MatchOnce(self, value):
+        self._stamp = _next_stamp()
+        self._MatchOnce = value
+
+    @property
+    def relation(self):
+        return self._relation
+
+    @relation.setter
+    def relation(self, value):
+        self._stamp = _next_stamp()
+        self._relation = value
+
+    @property
+    def quantity(self):
+        return self._quantity
+
+    @quantity.setter
+    def quantity(self, value):
+        self._stamp = _next_stamp()
+        self._quantity = value
+
+    @property
+    def molecules(self):
+        """
+        List of molecules of the pattern, it can be modified in place.
+        Setting it stores a copy of the given list, later changes to
+        the original list don't change the pattern.
+        """
+        return self._molecules
+
+    @molecules.setter
+    def molecules(self, value):
+        self._stamp = _next_stamp()
+        self._molecules = _tracked(value)
 
     @property
     def compartment(self):
@@ -318,16 +726,23 @@ class Pattern:
         # TODO: Build in logic to set the
         # outer compartment
         # print("Warning: Logical checks are not complete")
+        self._stamp = _next_stamp()
         self._compartment = value
 
     def consolidate_molecule_compartments(self):
+        # nothing changed since the last time
+        self._check_caches()
+        if self._consolidated:
+            return
         # if the molecule compartment matches overall pattern
         # compartment, don't print the molecule compartments
-        overall_comp = self.compartment
+        overall_comp = self._compartment
         if overall_comp is not None:
-            for molec in self.molecules:
+            for molec in self._molecules:
                 if molec.compartment == overall_comp:
                     molec.compartment = None
+        self._check_caches()
+        self._consolidated = True
 
     @property
     def label(self):
@@ -338,43 +753,59 @@ class Pattern:
         # TODO: Build in logic to set
         # the outer label
         # print("Warning: Logical checks are not complete")
+        self._stamp = _next_stamp()
         self._label = value
 
     def __str__(self):
-        # need to make sure we don't print useless compartments
-        self.consolidate_molecule_compartments()
-        sstr = ""
+        compartment = self._compartment
+        # need to make sure we don't print useless compartments,
+        # only possible if the pattern has a compartment
+        if compartment is not None:
+            self.consolidate_molecule_compartments()
+        # nothing changed since we last printed
+        self._check_caches()
+        if self._str_cache is not None:
+            return self._str_cache
+        label = self._label
+        relation = self._relation
+        parts = []
         # we first deal with the pattern compartment
-        if self.compartment is not None:
-            sstr += "@{}".format(self.compartment)
-        if self.label is not None:
-            sstr += "%{}".format(self.label)
-        if self.label is not None or self.compartment is not None:
-            sstr += ":"
+        if compartment is not None:
+            parts.append(f"@{compartment}")
+        if label is not None:
+            parts.append(f"%{label}")
+        if label is not None or compartment is not None:
+            parts.append(":")
         # now loop over all molecules
-        for imol, mol in enumerate(self.molecules):
+        for imol, mol in enumerate(self._molecules):
             if imol == 0:
-                if self.fixed:
-                    sstr += "$"
-                if self.MatchOnce:
-                    sstr += "{MatchOnce}"
+                if self._fixed:
+                    parts.append("$")
+                if self._MatchOnce:
+                    parts.append("{MatchOnce}")
             if imol > 0:
-                sstr += "."
-            sstr += str(mol)
-        if self.relation is not None:
-            sstr += f"{self.relation}{self.quantity}"
+                parts.append(".")
+            parts.append(str(mol))
+        if relation is not None:
+            parts.append(f"{relation}{self._quantity}")
+        sstr = "".join(parts)
+        self._str_cache = sstr
         return sstr
 
+    def __getstate__(self):
+        return _get_state(self)
+
+    def __setstate__(self, state):
+        _set_state(self, state)
+
     def __repr__(self):
         return str(self)
 
     def __getitem__(self, key):
-        return self.molecules[key]
+        return self._molecules[key]
 
     def __iter__(self):
-        return self.molecules.__iter__()
-
-    # TODO: Implement __contains__
+        return self._molecules.__iter__()
 
 
 class Molecule:
@@ -392,88 +823,174 @@ class Molecule:
     _label : str
         label of the molecule
     _components : list[Component]
-        list of components for this molecule
+        list of components for this molecule, a copy of the
+        list given to the constructor or the setter
 
     Methods
     -------
-    add_component(name, state=None, states=[])
+    add_component(name, state=None, states=None)
         add a component object to the list of components with name
         "name", current state "state" or a list of states
         (for molecule types) "states"
     """
 
-    def __init__(self, name="0", components=[], compartment=None, label=None):
+    __slots__ = (
+        "_name",
+        "_components",
+        "_compartment",
+        "_label",
+        "canonical_order",
+        "canonical_label",
+        "parent_pattern",
+        "parent",
+        "_stamp",
+        "_cache_stamp",
+        "_hash",
+        "_str_cache",
+        "_index",
+        "_canon_cache",
+    )
+    _cache_slots = (
+        "_stamp",
+        "_cache_stamp",
+        "_hash",
+        "_str_cache",
+        "_index",
+        "_canon_cache",
+    )
+
+    def __init__(self, name="0", components=None, compartment=None, label=None):
         self._name = name
-        self._components = components
+        self._components = _EMPTY if components is None else _tracked(components)
         self._compartment = compartment
         self._label = label
+        self._stamp = _next_stamp()
+        self._cache_stamp = None
+        self._hash = None
+        self._str_cache = None
+        self._index = None
+        self._canon_cache = None
         self.canonical_order = None
         self.canonical_label = None
         self.parent_pattern = None
+        self.parent = None
+
+    def _current_stamp(self):
+        # newest stamp anywhere in the molecule
+        stamp = max(self._stamp, self._components._stamp)
+        for component in self._components:
+            comp_stamp = _comp_stamp(component)
+            if comp_stamp > stamp:
+                stamp = comp_stamp
+        return stamp
+
+    def _check_caches(self):
+        # drops the cached values if anything in the molecule changed
+        # since they were made, needs to be called before using them
+        stamp = self._current_stamp()
+        if stamp != self._cache_stamp:
+            self._hash = None
+            self._str_cache = None
+            self._index = None
+            self._canon_cache = None
+            self._cache_stamp = stamp
 
     def __contains__(self, val):
-        return val in self.components
+        if not isinstance(val, Component):
+            return val in self._components
+        # only compare against components that can match
+        self._check_caches()
+        if self._index is None:
+            self._index = _bucket(self._components, _comp_key)
+        return any(val == c for c in self._index.get(_comp_key(val), ()))
+
+    def _canon_components(self):
+        # components sorted by hash and their hashes, used
+        # for comparing and hashing the molecule
+        self._check_caches()
+        if self._canon_cache is None:
+            self._canon_cache = _sort_by_hash(self._components)
+        return self._canon_cache
 
     def __eq__(self, other):
-        loc = f"{__file__} : Molecule.__eq__()"
-        # check object type
-        if isinstance(other, Molecule):
-            logger.debug(f"Comparison class matches: {other.__class__}", loc=loc)
-            # check attributes
-            if (
-                (other.name == self.name)
-                and (other.compartment == self.compartment)
-                and (other.label == self.label)
-            ):
-                logger.debug(
-                    f"name, compartment and labels match: {other.name}, {other.compartment}, {other.label}",
-                    loc=loc,
+        if self is other:
+            return True
+        if other.__class__ is not Molecule:
+            return False
+        # check attributes, cheapest first
+        if other._name != self._name:
+            return False
+        if len(other._components) != len(self._components):
+            return False
+        if other._compartment != self._compartment:
+            return False
+        if other._label != self._label:
+            return False
+        # we can check canonical labels
+        if (self.canonical_label is not None) and (other.canonical_label is not None):
+            if self.canonical_label != other.canonical_label:
+                return False
+        # check components now, every component needs
+        # its own match in the other molecule
+        if not _same_items(
+            *self._canon_components(), *other._canon_components(), _comp_key
+        ):
+            return False
+        # everything matches
+        if _DEBUG:
+            logger.debug(f"molecules match: {self}", loc=_LOC_MOL_EQ)
+        return True
+
+    def __hash__(self):
+        # consistent with __eq__, component order doesn't matter
+        canon_hashes = self._canon_components()[1]
+        if self._hash is None:
+            self._hash = hash(
+                (
+                    self._name,
+                    self._compartment,
+                    self._label,
+                    canon_hashes,
                 )
-                if (self.canonical_label is not None) and (
-                    other.canonical_label is not None
-                ):
-                    # we can check canonical labels
-                    if self.canonical_label != other.canonical_label:
-                        return False
-                # check components now
-                for component in self:
-                    if component not in other.components:
-                        logger.debug(f"component doesn't match: {component}", loc=loc)
-                        return False
-                # everything matches
-                logger.debug("molecules match", loc=loc)
-                return True
-        return False
+            )
+        return self._hash
 
     def __getitem__(self, key):
         if isinstance(key, int):
-            return self.components[key]
+            return self._components[key]
 
     def __iter__(self):
-        return self.components.__iter__()
+        return self._components.__iter__()
 
-    # TODO: implement __setitem__,  __contains__
+    # TODO: implement __setitem__
 
     def __str__(self):
-        mol_str = self.name
+        # nothing changed since we last printed
+        self._check_caches()
+        if self._str_cache is not None:
+            return self._str_cache
+        name = self._name
+        compartment = self._compartment
+        label = self._label
+        components = self._components
+        parts = [name]
         # we have a null species
-        if not self.name == "0":
-            mol_str += "("
+        if not name == "0":
+            parts.append("(")
         # we _could_ just not do () if components
         # don't exist but that has other issues,
         # especially for extension highlighting
-        if len(self.components) > 0:
-            for icomp, comp in enumerate(self.components):
-                if icomp > 0:
-                    mol_str += ","
-                mol_str += str(comp)
+        if len(components) > 0:
+            parts.append(",".join([str(comp) for comp in components]))
         # we have a null species
-        if not self.name == "0":
-            mol_str += ")"
-        if self.compartment is not None:
-            mol_str += "@{}".format(self.compartment)
-        if self.label is not None:
-            mol_str += "%{}".format(self.label)
+        if not name == "0":
+            parts.append(")")
+        if compartment is not None:
+            parts.append(f"@{compartment}")
+        if label is not None:
+            parts.append(f"%{label}")
+        mol_str = "".join(parts)
+        self._str_cache = mol_str
         return mol_str
 
     def print_canonical(self):
@@ -481,30 +998,33 @@ class Molecule:
         Returns canonical label for the pattern
         """
         # print in canonical order
-        canon_label = self.name
+        parts = [self.name]
         # we have a null species
         if not self.name == "0":
-            canon_label += "("
+            parts.append("(")
         # we _could_ just not do () if components
         # don't exist but that has other issues,
         # especially for extension highlighting
-        if len(self.components) > 0:
-            canon_ords = [c.canonical_order for c in self.components]
-            canon_ord_pairs = zip(range(len(self.components)), canon_ords)
+        if len(self._components) > 0:
+            canon_ords = [c.canonical_order for c in self._components]
+            canon_ord_pairs = zip(range(len(self._components)), canon_ords)
             sorted_canon_ord_pairs = sorted(canon_ord_pairs, key=lambda x: x[1])
-            for icomp, comp in enumerate(sorted_canon_ord_pairs):
-                comp_id = comp[0]
-                if icomp > 0:
-                    canon_label += ","
-                canon_label += self.components[comp_id].print_canonical()
+            parts.append(
+                ",".join(
+                    [
+                        self._components[comp_id].print_canonical()
+                        for comp_id, _ in sorted_canon_ord_pairs
+                    ]
+                )
+            )
         # we have a null species
         if not self.name == "0":
-            canon_label += ")"
+            parts.append(")")
         if self.compartment is not None:
-            canon_label += "@{}".format(self.compartment)
+            parts.append(f"@{self.compartment}")
         if self.label is not None:
-            canon_label += "%{}".format(self.label)
-        return canon_label
+            parts.append(f"%{self.label}")
+        return "".join(parts)
 
     ### PROPERTIES ###
     @property
@@ -515,16 +1035,31 @@ class Molecule:
     def name(self, value):
         # print("Warning: Logical checks are not complete")
         # TODO: Check for invalid characters
+        self._stamp = _next_stamp()
         self._name = value
 
     @property
     def components(self):
+        """
+        List of components of the molecule, it can be modified in place.
+        Setting it stores a copy of the given list, later changes to
+        the original list don't change the molecule.
+        """
+        if self._components is _EMPTY:
+            self._components = _TrackedList()
         return self._components
 
     @components.setter
     def components(self, value):
         # print("Warning: Logical checks are not complete")
-        self._components = value
+        self._stamp = _next_stamp()
+        self._components = _tracked(value)
+
+    def __getstate__(self):
+        return _get_state(self)
+
+    def __setstate__(self, state):
+        _set_state(self, state)
 
     def __repr__(self):
         return str(self)
@@ -536,6 +1071,7 @@ class Molecule:
     @compartment.setter
     def compartment(self, value):
         # print("Warning: Logical checks are not complete")
+        self._stamp = _next_stamp()
         self._compartment = value
 
     @property
@@ -545,16 +1081,17 @@ class Molecule:
     @label.setter
     def label(self, value):
         # print("Warning: Logical checks are not complete")
+        self._stamp = _next_stamp()
         self._label = value
 
-    def _add_component(self, name, state=None, states=[]):
+    def _add_component(self, name, state=None, states=None):
         comp_obj = Component()
         comp_obj.name = name
         comp_obj.state = state
-        comp_obj.states = states
+        comp_obj.states = _EMPTY if states is None else states
         self.components.append(comp_obj)
 
-    def add_component(self, name, state=None, states=[]):
+    def add_component(self, name, state=None, states=None):
         # TODO: Add built-in logic here
         # print("Warning: Logical checks are not complete")
         self._add_component(name, state, states)
@@ -574,9 +1111,11 @@ class Component:
     _state : str
         state of the component, not used for molecule types
     _states : list[str]
-        list of states for molecule types
+        list of states for molecule types, a copy of the list
+        given to the setter
     _bonds : list[Bond]
-        list of bond objects that describes bonding of the component
+        list of bond objects that describes bonding of the component,
+        a copy of the list given to the setter
 
     Methods
     -------
@@ -588,91 +1127,124 @@ class Component:
         to an existing component
     """
 
+    __slots__ = (
+        "_name",
+        "_label",
+        "_state",
+        "_states",
+        "_bonds",
+        "canonical_label",
+        "canonical_order",
+        "canonical_bonds",
+        "parent_molecule",
+        "_stamp",
+        "_str_cache",
+        "_str_stamp",
+    )
+    _cache_slots = ("_stamp", "_str_cache", "_str_stamp")
+
     def __init__(self):
         self._name = ""
         self._label = None
         self._state = None
-        self._states = []
-        self._bonds = []
+        self._states = _EMPTY
+        self._bonds = _EMPTY
+        self._stamp = _next_stamp()
+        self._str_cache = None
+        self._str_stamp = None
         self.canonical_label = None
         self.canonical_order = None
         self.canonical_bonds = None
         self.parent_molecule = None
 
     def __eq__(self, other):
-        loc = f"{__file__} : Component.__eq__()"
-        # check type
-        # import ipdb;ipdb.set_trace()
-        if isinstance(other, Component):
-            logger.debug(f"Comparison class matches: {other.__class__}", loc=loc)
-            # check attributes
-            if (other.name == self.name) and (other.label == self.label):
-                logger.debug(
-                    f"name and labels match: {other.name}, {other.label}", loc=loc
-                )
-                # check states
-                if len(other.states) == len(self.states):
-                    logger.debug(f"state lists match: {other.states}", loc=loc)
-                    # check current state
-                    if other.state == self.state:
-                        logger.debug(f"states match: {other.state}", loc=loc)
-                        if (self.canonical_label is not None) and (
-                            other.canonical_label is not None
-                        ):
-                            # we can check canonical labels
-                            if self.canonical_label != other.canonical_label:
-                                return False
-                        # check bonds
-                        # TODO: try to decide if A(b!1).B(a!1) is the same
-                        # as A(b!2).B(a!2), if so, the bond check is much harder
-                        # for bond in self.bonds:
-                        #     if bond not in other.bonds:
-                        #         logger.debug(
-                        #             f"bonds don't match!: {other.bonds}", loc=loc
-                        #         )
-                        #         return False
-                        if len(self.bonds) == len(other.bonds):
-                            logger.debug("components match", loc=loc)
-                            return True
-        return False
+        if self is other:
+            return True
+        if other.__class__ is not Component:
+            return False
+        # cheapest checks that are most likely to differ first,
+        # name and current state
+        if other._name != self._name:
+            return False
+        if other._state != self._state:
+            return False
+        # bond labels are only meaningful within a pattern,
+        # A(b!1).B(a!1) is the same as A(b!2).B(a!2), so only
+        # the number of bonds and the wildcards are compared here
+        # and the bonds themselves are compared in Pattern.__eq__
+        if len(other._bonds) != len(self._bonds):
+            return False
+        if self._bonds and (
+            _wildcard_bonds(self._bonds) != _wildcard_bonds(other._bonds)
+        ):
+            return False
+        if len(other._states) != len(self._states):
+            return False
+        if other._label != self._label:
+            return False
+        # we can check canonical labels
+        if (self.canonical_label is not None) and (other.canonical_label is not None):
+            if self.canonical_label != other.canonical_label:
+                return False
+        if _DEBUG:
+            logger.debug(f"components match: {self}", loc=_LOC_COMP_EQ)
+        return True
+
+    def __hash__(self):
+        # consistent with __eq__, which only checks
+        # the number of states and not the states
+        return hash((self._name, self._label, self._state, len(self._states)))
+
+    def __getstate__(self):
+        return _get_state(self)
+
+    def __setstate__(self, state):
+        _set_state(self, state)
 
     def __repr__(self):
         return str(self)
 
     def __str__(self):
-        comp_str = self.name
+        # nothing changed since we last printed
+        stamp = _comp_stamp(self)
+        if self._str_stamp == stamp:
+            return self._str_cache
+        state = self._state
+        label = self._label
+        parts = [self._name]
         # only for molecule types
-        if len(self.states) > 0:
-            for istate, state in enumerate(self.states):
-                comp_str += "~{}".format(state)
+        for state_name in self._states:
+            parts.append(f"~{state_name}")
         # for any other pattern
-        if self.state is not None:
-            comp_str += "~{}".format(self.state)
-        if self.label is not None:
-            comp_str += "%{}".format(self.label)
-        if len(self.bonds) > 0:
-            for bond in self.bonds:
-                comp_str += "!{}".format(bond)
+        if state is not None:
+            parts.append(f"~{state}")
+        if label is not None:
+            parts.append(f"%{label}")
+        for bond in self._bonds:
+            parts.append(f"!{bond}")
+        comp_str = "".join(parts)
+        self._str_cache = comp_str
+        self._str_stamp = stamp
         return comp_str
 
     def print_canonical(self):
         """
         Returns canonical label for the pattern
         """
-        comp_str = self.name
+        parts = [self.name]
         # only for molecule types
-        if len(self.states) > 0:
-            for istate, state in enumerate(self.states):
-                comp_str += "~{}".format(state)
+        if len(self._states) > 0:
+            for state in self._states:
+                parts.append(f"~{state}")
         # for any other pattern
         if self.state is not None:
-            comp_str += "~{}".format(self.state)
+            parts.append(f"~{self.state}")
         if self.label is not None:
-            comp_str += "%{}".format(self.label)
+            parts.append(f"%{self.label}")
         if self.canonical_bonds is not None:
             for bond in self.canonical_bonds:
-                comp_str += "!{}".format(bond)
-        return comp_str
+                parts.append(f"!{bond}")
+        return "".join(parts)
 
     ### PROPERTIES ###
     @property
@@ -683,6 +1255,7 @@ class Component:
     def name(self, value):
         # TODO: Add built-in logic here
         # print("Warning: Logical checks are not complete")
+        self._stamp = _next_stamp()
         self._name = value
 
     @property
@@ -693,6 +1266,7 @@ class Component:
     def label(self, value):
         # TODO: Add built-in logic here
         # print("Warning: Logical checks are not complete")
+        self._stamp = _next_stamp()
         self._label = value
 
     @property
@@ -703,27 +1277,44 @@ class Component:
     def state(self, value):
         # TODO: Add built-in logic here
         # print("Warning: Logical checks are not complete")
+        self._stamp = _next_stamp()
         self._state = value
 
     @property
     def states(self):
+        """
+        List of states of the component, it can be modified in place.
+        Setting it stores a copy of the given list, later changes to
+        the original list don't change the component.
+        """
+        if self._states is _EMPTY:
+            self._states = _TrackedList()
         return self._states
 
     @states.setter
     def states(self, value):
         # TODO: Add built-in logic here
         # print("Warning: Logical checks are not complete")
-        self._states = value
+        self._stamp = _next_stamp()
+        self._states = _tracked(value)
 
     @property
     def bonds(self):
+        """
+        List of bonds of the component, it can be modified in place.
+        Setting it stores a copy of the given list, later changes to
+        the original list don't change the component.
+        """
+        if self._bonds is _EMPTY:
+            self._bonds = _TrackedList()
         return self._bonds
 
     @bonds.setter
     def bonds(self, value):
         # TODO: Add built-in logic here
         # print("Warning: Logical checks are not complete")
-        self._bonds = value
+        self._stamp = _next_stamp()
+        self._bonds = _tracked(value)
 
     def _add_state(self):
         raise NotImplementedError
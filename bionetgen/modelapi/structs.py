@@ -261,9 +261,9 @@ class Species(ModelObj):
         starting value of the seed species
     """
 
-    def __init__(self, pattern=Pattern(), count=0):
+    def __init__(self, pattern=None, count=0):
         super().__init__()
-        self.pattern = pattern
+        self.pattern = Pattern() if pattern is None else pattern
         self.count = count
         self.name = str(self.pattern)
 
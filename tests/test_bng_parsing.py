@@ -73,3 +73,182 @@ def test_pattern_canonicalization():
             break
     # assert that everything matched up
     assert res is True
+
+
+def _make_pattern(spec):
+    # spec is a list of (molecule name, [(component name, bonds)])
+    from bionetgen.modelapi.pattern import Pattern, Molecule, Component
+
+    molecules = []
+    for mol_name, comps in spec:
+        components = []
+        for comp_name, bonds in comps:
+            comp = Component()
+            comp.name = comp_name
+            comp.bonds = list(bonds)
+            components.append(comp)
+        molecules.append(Molecule(name=mol_name, components=components))
+    return Pattern(molecules=molecules)
+
+
+def test_pattern_equality_counts_molecules():
+    pat_ab = _make_pattern([("A", []), ("B", [])])
+    pat_ba = _make_pattern([("B", []), ("A", [])])
+    pat_aa = _make_pattern([("A", []), ("A", [])])
+    assert pat_ab == pat_ba
+    # each molecule needs its own match
+    assert pat_aa != pat_ab
+    assert pat_ab != pat_aa
+    assert _make_pattern([("A", [])]) != pat_aa
+
+
+def _make_bonded_pattern(bonds1=(), bonds2=()):
+    # A(b).B(a) with the given bonds on b and a
+    return _make_pattern([("A", [("b", bonds1)]), ("B", [("a", bonds2)])])
+
+
+def test_pattern_hash_follows_changes():
+    pat = _make_bonded_pattern()
+    bonded = _make_bonded_pattern(["1"], ["1"])
+    # hash and compare before changing the pattern
+    hash(pat)
+    assert pat != bonded
+    # changes through the lists we got from the pattern
+    bonds = pat[0][0].bonds
+    pat.molecules[1].components[0].bonds.append("1")
+    bonds.append("1")
+    assert pat == bonded
+    assert hash(pat) == hash(bonded)
+    # looking at another pattern doesn't change anything
+    other = _make_bonded_pattern()
+    other[0][0].bonds
+    assert hash(pat) == hash(bonded)
+
+
+def test_pattern_str_follows_changes():
+    from bionetgen.modelapi.pattern import Component
+
+    pat = _make_bonded_pattern()
+    comp = pat[0][0]
+    bonds = comp.bonds
+    assert str(pat) == "A(b).B(a)"
+    # changes through a list kept from before printing
+    bonds.append("1")
+    assert str(comp) == "b!1"
+    assert str(pat) == "A(b!1).B(a)"
+    new_comp = Component()
+    new_comp.name = "c"
+    pat.molecules[1].components.append(new_comp)
+    assert str(pat) == "A(b!1).B(a,c)"
+    new_comp.state = "P"
+    assert str(pat) == "A(b!1).B(a,c~P)"
+
+
+def test_pattern_equality_ignores_bond_labels():
+    # A(b!1).B(a!1) == A(b!2).B(a!2)
+    pat1 = _make_pattern([("A", [("b", ["1"])]), ("B", [("a", ["1"])])])
+    pat2 = _make_pattern([("A", [("b", ["2"])]), ("B", [("a", ["2"])])])
+    assert pat1 == pat2
+    assert hash(pat1) == hash(pat2)
+    # same molecules, different components bonded
+    # A(b!1,c).B(a!1) != A(b,c!1).B(a!1)
+    pat3 = _make_pattern([("A", [("b", ["1"]), ("c", [])]), ("B", [("a", ["1"])])])
+    pat4 = _make_pattern([("A", [("b", []), ("c", ["1"])]), ("B", [("a", ["1"])])])
+    assert pat3 != pat4
+    # A(b!1).B(a!1).C(a) != A(b!1).B(a).C(a!1)
+    pat5 = _make_pattern(
+        [("A", [("b", ["1"])]), ("B", [("a", ["1"])]), ("C", [("a", [])])]
+    )
+    pat6 = _make_pattern(
+        [("A", [("b", ["1"])]), ("B", [("a", [])]), ("C", [("a", ["1"])])]
+    )
+    assert pat5 != pat6
+    # bonds within a molecule aren't bonds between molecules
+    # A(b!1,c!1).A(b!2,c!2) != A(b!1,c!2).A(b!2,c!1)
+    pat7 = _make_pattern(
+        [("A", [("b", ["1"]), ("c", ["1"])]), ("A", [("b", ["2"]), ("c", ["2"])])]
+    )
+    pat8 = _make_pattern(
+        [("A", [("b", ["1"]), ("c", ["2"])]), ("A", [("b", ["2"]), ("c", ["1"])])]
+    )
+    assert pat7 != pat8
+    assert pat8 == _make_pattern(
+        [("A", [("b", ["3"]), ("c", ["4"])]), ("A", [("b", ["4"]), ("c", ["3"])])]
+    )
+
+
+def test_pattern_equality_wildcard_bonds():
+    bound = _make_pattern([("A", [("b", ["+"])])])
+    maybe_bound = _make_pattern([("A", [("b", ["?"])])])
+    unbound = _make_pattern([("A", [("b", [])])])
+    # A(b!+) != A(b!?), A(b!+) != A(b)
+    assert bound != maybe_bound
+    assert bound[0][0] != maybe_bound[0][0]
+    assert bound != unbound
+    assert bound[0][0] != unbound[0][0]
+    # wildcards mean the same thing in every pattern
+    other_bound = _make_pattern([("A", [("b", ["+"])])])
+    assert bound == other_bound
+    assert hash(bound) == hash(other_bound)
+    assert bound[0][0] == other_bound[0][0]
+    assert hash(bound[0][0]) == hash(other_bound[0][0])
+
+
+def test_pattern_copies_keep_empty_lists():
+    import copy, pickle
+    from bionetgen.modelapi.pattern import Pattern, Molecule, Component
+
+    comp = Component()
+    comp.name = "b"
+    pat = Pattern(molecules=[Molecule(name="A", components=[comp])])
+    for pat_copy in [copy.deepcopy(pat), pickle.loads(pickle.dumps(pat))]:
+        # components that never had bonds or states can still get them
+        comp_copy = pat_copy[0][0]
+        comp_copy.states.append("P")
+        comp_copy.bonds.append("+")
+        assert str(pat_copy) == "A(b~P!+)"
+    assert str(pat) == "A(b)"
+
+
+def test_pattern_pickle_in_new_process():
+    import pickle, subprocess, sys
+
+    pat = _make_pattern([("A", [("b", []), ("a", [])])])
+    assert str(pat) == "A(b,a)"
+    # stamps from this process mean nothing to a new one
+    code = (
+        "import pickle, sys\n"
+        "pat = pickle.loads(sys.stdin.buffer.read())\n"
+        "str(pat)\n"
+        "pat[0][0].name = 'z'\n"
+        "print(pat)\n"
+    )
+    res = subprocess.run(
+        [sys.executable, "-c", code],
+        input=pickle.dumps(pat),
+        capture_output=True,
+        # other tests move around, run where bionetgen can be imported
+        cwd=os.path.dirname(tfold),
+        check=True,
+    )
+    assert res.stdout.decode().strip() == "A(z,a)"
+
+
+def test_pattern_setters_copy_lists():
+    from bionetgen.modelapi.pattern import Molecule, Component
+
+    comp = Component()
+    comp.name = "b"
+    bonds = []
+    comp.bonds = bonds
+    comps = [comp]
+    mol = Molecule(name="A", components=comps)
+    # the object keeps its own copy of the lists
+    bonds.append("1")
+    comps.append(Component())
+    assert str(mol) == "A(b)"
+    # changes go through the object instead
+    comp.bonds.append("1")
+    mol.components.append(Component())
+    mol.components[1].name = "c"
+    assert str(mol) == "A(b!1,c)"
@@ -38,6 +38,74 @@ def test_bionetgen_visualize():
                 assert len(graphmls) == 4
 
 
+def test_bionetgen_visualize_all_single_run(monkeypatch):
+    # all visualization types should come out of a single BNG2.pl call
+    from bionetgen.core.utils import utils
+    from bionetgen.core.tools import BNGVisualize
+
+    calls = []
+    run_command = utils.run_command
+
+    def counting_run_command(command, **kwargs):
+        calls.append(command)
+        return run_command(command, **kwargs)
+
+    monkeypatch.setattr(utils, "run_command", counting_run_command)
+    cur_dir = os.getcwd()
+    try:
+        vis = BNGVisualize(
+            os.path.join(tfold, "test.bngl"),
+            output=os.path.join(tfold, "viz"),
+            vtype="all",
+            bngpath=bng.defaults.bng_path,
+        )
+        vis_res = vis.run()
+    finally:
+        os.chdir(cur_dir)
+    # finding BNG2.pl also goes through run_command, only count
+    # the calls that actually run a model
+    model_calls = [c for c in calls if any(arg.endswith(".bngl") for arg in c)]
+    assert len(model_calls) == 1
+    assert len(vis_res.files) == 4
+
+
+def test_visresult_folder_scan(tmp_path):
+    # without expected files the folder is searched for graphs
+    from bionetgen.core.tools.visualize import VisResult
+
+    for fname in [
+        "test_contactmap.graphml",
+        "test_regulatory.gml",
+        "other_ruleviz_pattern.graphml",
+        "test_custom.graphml",
+        "test.bngl",
+    ]:
+        (tmp_path / fname).write_text("<graphml/>")
+    vis_res = VisResult(str(tmp_path), name="test")
+    assert sorted(vis_res.files) == [
+        "test_contactmap.graphml",
+        "test_custom.graphml",
+        "test_regulatory.gml",
+    ]
+    assert vis_res.files_by_type == {
+        "contactmap": ["test_contactmap.graphml"],
+        "regulatory": ["test_regulatory.gml"],
+    }
+    assert vis_res.file_strs["test_regulatory.gml"] == "<graphml/>"
+    # no name picks up every graph in the folder
+    vis_res = VisResult(str(tmp_path))
+    assert len(vis_res.files) == 4
+    assert vis_res.files_by_type["ruleviz_pattern"] == ["other_ruleviz_pattern.graphml"]
+    # expected files only list the types that were written
+    vis_res = VisResult(
+        str(tmp_path),
+        name="test",
+        expected_files=[("test", "contactmap"), ("test", "ruleviz_pattern")],
+    )
+    assert vis_res.files == ["test_contactmap.graphml"]
+    assert vis_res.files_by_type == {"contactmap": ["test_contactmap.graphml"]}
+
+
 # def test_graphdiff_matrix():
 #     valid = []
 #     invalid = []